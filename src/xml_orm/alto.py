@@ -0,0 +1,281 @@
+"""
+Columnar, word-level view on ALTO XML.
+
+# Examples on how to use.
+>> words = ALTOXML('PATH_TO_ALTO_XML').get_words()
+>> words = words[words.confidence >= .5]
+>> words.get_lines_confidence()
+>> words.get_lines_text()
+
+# Over multiple pages.
+>> words = ALTOWords.concatenate([ALTOXML(filename).get_words() for filename in l_filenames])
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+ALTO_NAMESPACES = {'alto-1': 'http://schema.ccs-gmbh.com/ALTO',
+                   'alto-2': 'http://www.loc.gov/standards/alto/ns-v2#',
+                   'alto-3': 'http://www.loc.gov/standards/alto/ns-v3#'}
+
+_SEP_WORD = ord(' ')
+_SEP_LINE = ord('\n')
+
+
+class ALTOWords:
+    """
+    All the String elements of one or more ALTO pages, stored column-wise in NumPy arrays.
+
+    The text of word i is encoded in UTF-8 in text_buffer[offsets[i]:offsets[i + 1]].
+    Block and line indices are global: they keep increasing over the pages.
+    """
+
+    def __init__(self,
+                 hpos: np.ndarray,
+                 vpos: np.ndarray,
+                 width: np.ndarray,
+                 height: np.ndarray,
+                 confidence: np.ndarray,
+                 page: np.ndarray,
+                 block: np.ndarray,
+                 line: np.ndarray,
+                 offsets: np.ndarray,
+                 text_buffer: np.ndarray):
+        """
+
+        :param hpos: horizontal position of each word.
+        :param vpos: vertical position of each word.
+        :param width: width of each word.
+        :param height: height of each word.
+        :param confidence: word confidence (WC), NaN if not given.
+        :param page: page index of each word.
+        :param block: TextBlock index of each word.
+        :param line: TextLine index of each word.
+        :param offsets: n_words + 1 byte offsets into text_buffer.
+        :param text_buffer: uint8 array with the UTF-8 encoded text of all the words.
+        """
+        self.hpos = hpos
+        self.vpos = vpos
+        self.width = width
+        self.height = height
+        self.confidence = confidence
+        self.page = page
+        self.block = block
+        self.line = line
+        self.offsets = offsets
+        self.text_buffer = text_buffer
+
+    @classmethod
+    def from_element_tree(cls, element_tree, xmlns, page: int = 0):
+        """ Extract all the String elements of an ALTO element tree in a single pass.
+
+        :param element_tree: lxml element tree of an ALTO file.
+        :param xmlns: ALTO namespace of the file.
+        :param page: page index to assign to the words.
+        :return: ALTOWords
+            Missing or invalid coordinates and confidences are NaN.
+        """
+
+        tag_block = '{%s}TextBlock' % xmlns
+        tag_line = '{%s}TextLine' % xmlns
+        tag_string = '{%s}String' % xmlns
+
+        l_coords = []
+        l_confidence = []
+        l_block = []
+        l_line = []
+        l_text = []
+
+        i_block = -1
+        i_line = -1
+        for el in element_tree.iter(tag_block, tag_line, tag_string):
+            tag = el.tag
+            if tag == tag_string:
+                attrib = el.attrib
+                l_coords.append((attrib.get('HPOS', 'nan'),
+                                 attrib.get('VPOS', 'nan'),
+                                 attrib.get('WIDTH', 'nan'),
+                                 attrib.get('HEIGHT', 'nan')))
+                l_confidence.append(attrib.get('WC', 'nan'))
+                l_block.append(i_block)
+                l_line.append(i_line)
+                l_text.append(attrib.get('CONTENT', ''))
+            elif tag == tag_line:
+                i_line += 1
+            else:
+                i_block += 1
+
+        coords = _to_float_array(l_coords).reshape(-1, 4)
+
+        l_bytes = [text.encode('utf-8') for text in l_text]
+        lengths = np.fromiter(map(len, l_bytes), dtype=np.int64, count=len(l_bytes))
+        offsets = np.zeros(len(l_bytes) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        return cls(hpos=coords[:, 0],
+                   vpos=coords[:, 1],
+                   width=coords[:, 2],
+                   height=coords[:, 3],
+                   confidence=_to_float_array(l_confidence),
+                   page=np.full(len(l_bytes), page, dtype=np.int64),
+                   block=np.array(l_block, dtype=np.int64),
+                   line=np.array(l_line, dtype=np.int64),
+                   offsets=offsets,
+                   text_buffer=np.frombuffer(b''.join(l_bytes), dtype=np.uint8))
+
+    @classmethod
+    def concatenate(cls, l_words: Sequence['ALTOWords']):
+        """ Combine the words of multiple pages.
+
+        Pages are renumbered by their position in l_words, whatever page index they were given in get_words.
+        Block and line indices are shifted such that they stay unique over the pages.
+
+        :param l_words: list of ALTOWords, e.g. one per page.
+        :return: ALTOWords
+        """
+
+        if not l_words:
+            raise ValueError('Expected at least one ALTOWords to concatenate.')
+
+        l_page, l_block, l_line, l_offsets = [], [], [], []
+        page_shift = block_shift = line_shift = offset_shift = 0
+        for words in l_words:
+            # Renumber pages from 0, also if words spans multiple pages already.
+            l_page_words, page_words = np.unique(words.page, return_inverse=True)
+            l_page.append(page_words.reshape(-1) + page_shift)
+            l_block.append(words.block + block_shift)
+            l_line.append(words.line + line_shift)
+            l_offsets.append(words.offsets[:-1] + offset_shift)
+
+            page_shift += max(len(l_page_words), 1)
+            block_shift += _n_indices(words.block)
+            line_shift += _n_indices(words.line)
+            offset_shift += len(words.text_buffer)
+
+        l_offsets.append(np.array([offset_shift], dtype=np.int64))
+
+        return cls(hpos=np.concatenate([words.hpos for words in l_words]),
+                   vpos=np.concatenate([words.vpos for words in l_words]),
+                   width=np.concatenate([words.width for words in l_words]),
+                   height=np.concatenate([words.height for words in l_words]),
+                   confidence=np.concatenate([words.confidence for words in l_words]),
+                   page=np.concatenate(l_page),
+                   block=np.concatenate(l_block),
+                   line=np.concatenate(l_line),
+                   offsets=np.concatenate(l_offsets),
+                   text_buffer=np.concatenate([words.text_buffer for words in l_words]))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, item):
+        """ Select words with a boolean mask, an index (array) or a slice.
+
+        The selected words are always kept in document order, as get_lines_text relies on it.
+        The text buffer is gathered without looping over the words.
+        """
+
+        idx = np.sort(np.atleast_1d(np.arange(len(self))[item]))
+        lengths = self.get_lengths()[idx]
+
+        offsets = np.zeros(len(idx) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # Byte positions in the old buffer: start of the word + position within the word.
+        i_char = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - self.offsets[idx], lengths)
+
+        return type(self)(hpos=self.hpos[idx],
+                          vpos=self.vpos[idx],
+                          width=self.width[idx],
+                          height=self.height[idx],
+                          confidence=self.confidence[idx],
+                          page=self.page[idx],
+                          block=self.block[idx],
+                          line=self.line[idx],
+                          offsets=offsets,
+                          text_buffer=self.text_buffer[i_char])
+
+    def get_lengths(self) -> np.ndarray:
+        """ Length in bytes of every word. """
+        return np.diff(self.offsets)
+
+    def get_words_text(self) -> List[str]:
+        text = bytes(self.text_buffer)
+        return [text[i0:i1].decode('utf-8') for i0, i1 in zip(self.offsets[:-1], self.offsets[1:])]
+
+    def filter_confidence(self, threshold: float) -> 'ALTOWords':
+        """ Only keep the words with a confidence of at least threshold.
+
+        Words without confidence (NaN) are removed too.
+        """
+        return self[self.confidence >= threshold]
+
+    def get_lines_confidence(self) -> np.ndarray:
+        """ Mean word confidence per line.
+
+        :return:
+            array indexed by line index, NaN for lines without (rated) words.
+        """
+
+        n_lines = _n_indices(self.line)
+        b_rated = ~np.isnan(self.confidence)
+
+        total = np.bincount(self.line[b_rated], weights=self.confidence[b_rated], minlength=n_lines)
+        count = np.bincount(self.line[b_rated], minlength=n_lines)
+
+        return np.divide(total, count, out=np.full(n_lines, np.nan), where=count > 0)
+
+    def get_lines_text(self) -> List[str]:
+        """ Join the words into text lines, separated by a space.
+
+        :return:
+            list indexed by line index, like get_lines_confidence.
+            Empty string for lines without (remaining) words.
+        """
+
+        n = len(self)
+        if not n:
+            return []
+
+        # Every word is followed by one separator byte.
+        text_joined = np.empty(len(self.text_buffer) + n, dtype=np.uint8)
+        i_sep = self.offsets[1:] + np.arange(n)
+        b_sep = np.ones(len(text_joined), dtype=bool)
+        b_sep[i_sep] = False
+        text_joined[b_sep] = self.text_buffer
+
+        b_line_end = np.ones(n, dtype=bool)
+        b_line_end[:-1] = self.line[1:] != self.line[:-1]
+        text_joined[i_sep] = np.where(b_line_end, _SEP_LINE, _SEP_WORD)
+
+        l_lines_text = [''] * _n_indices(self.line)
+        for i_line, text_line in zip(self.line[b_line_end], bytes(text_joined[:-1]).decode('utf-8').split('\n')):
+            l_lines_text[i_line] = text_line
+
+        return l_lines_text
+
+    def get_text(self) -> str:
+        """ All the lines with words, separated by a newline. """
+        return '\n'.join(text_line for text_line in self.get_lines_text() if text_line)
+
+
+def _to_float_array(l_values) -> np.ndarray:
+    """ Convert (nested lists of) strings to floats, with NaN for invalid values such as '12.5px'. """
+
+    try:
+        return np.array(l_values, dtype=float)
+    except ValueError:
+        return np.array([_to_float_array(v) if isinstance(v, (list, tuple)) else _to_float(v) for v in l_values],
+                        dtype=float)
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+def _n_indices(a: np.ndarray) -> int:
+    return int(a.max()) + 1 if a.size else 0
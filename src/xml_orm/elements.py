@@ -0,0 +1,236 @@
+"""
+Lightweight, typed objects on top of the lxml elements of (multilingual) Page XML.
+
+The objects only hold a reference to their element, they are created lazily while iterating
+and changes are written directly to the underlying element tree.
+
+# Examples on how to use.
+>> xml = XLIFFPageXML.from_page('PATH_TO_PAGE_XML', source_lang='nl')
+>> for text_line in xml.iter_text_lines():
+>>     text_line.id, text_line.coords, text_line.text
+>>     text_line.trans_unit.set_target('en', 'translation')
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from .xml.xml_shared import XML_NAMESPACE, _get_tag
+
+_TAG_LANG = _get_tag("lang", XML_NAMESPACE)
+_TAGS_AFTER_TEXT_EQUIV = ('TextStyle', 'UserDefined', 'Labels')
+
+
+class _ElementProxy:
+    """
+    Base class that wraps a Page XML element.
+    """
+
+    __slots__ = ('element', 'xmlns')
+
+    def __init__(self, element: etree.ElementBase, xmlns: str):
+        """
+
+        :param element: lxml element.
+        :param xmlns: namespace of the Page XML.
+        """
+        self.element = element
+        self.xmlns = xmlns
+
+    def __repr__(self):
+        return f'{type(self).__name__}(id={self.id!r})'
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.element.get('id')
+
+    @id.setter
+    def id(self, value: str):
+        self.element.set('id', value)
+
+    def _tag(self, tag):
+        return _get_tag(tag, self.xmlns)
+
+
+class _TextElementProxy(_ElementProxy):
+    """
+    Page XML element with a polygon (Coords) and text (TextEquiv/Unicode).
+    """
+
+    __slots__ = ()
+
+    @property
+    def coords(self) -> List[Tuple[int, int]]:
+        """ Polygon as a list of (x, y) points, empty if not available. """
+
+        coords = self.element.find(self._tag('Coords'))
+        if coords is None:
+            return []
+
+        return [tuple(int(float(v)) for v in point.split(',')) for point in coords.get('points', '').split()]
+
+    @coords.setter
+    def coords(self, points: List[Tuple[int, int]]):
+        coords = self.element.find(self._tag('Coords'))
+        if coords is None:
+            coords = etree.Element(self._tag('Coords'))
+            self.element.insert(0, coords)  # Coords is always the first child
+
+        coords.set('points', ' '.join(f'{x},{y}' for x, y in points))
+
+    @property
+    def language(self) -> Optional[str]:
+        """ primaryLanguage of the element, inherited from the text region or page if not defined. """
+
+        l_lang = self.element.xpath('ancestor-or-self::*[@primaryLanguage][1]/@primaryLanguage')
+        return l_lang[0] if l_lang else None
+
+    @language.setter
+    def language(self, value: str):
+        self.element.set('primaryLanguage', value)
+
+    @property
+    def text(self) -> str:
+        """ Text of the TextEquiv, stripped. Empty string if not available. """
+
+        unicode = self.element.find(f'{self._tag("TextEquiv")}/{self._tag("Unicode")}')
+        if unicode is None or not unicode.text:
+            return ''
+        return unicode.text.strip()
+
+    @text.setter
+    def text(self, value: str):
+        text_equiv = self.element.find(self._tag('TextEquiv'))
+        if text_equiv is None:
+            text_equiv = etree.Element(self._tag('TextEquiv'))
+
+            # Schema order: TextEquiv goes after the content (Coords, TextLine, Word, ...) and before TextStyle etc.
+            i = len(self.element)
+            while i and etree.QName(self.element[i - 1]).localname in _TAGS_AFTER_TEXT_EQUIV:
+                i -= 1
+            self.element.insert(i, text_equiv)
+
+        unicode = text_equiv.find(self._tag('Unicode'))
+        if unicode is None:
+            unicode = etree.Element(self._tag('Unicode'))
+            plain_text = text_equiv.find(self._tag('PlainText'))
+            if plain_text is not None:
+                plain_text.addnext(unicode)
+            else:
+                text_equiv.insert(0, unicode)
+
+        unicode.text = value
+
+
+class TextRegion(_TextElementProxy):
+    __slots__ = ()
+
+    def iter_text_lines(self) -> Iterator['TextLine']:
+        for element in self.element.iterfind('.//%s' % self._tag('TextLine')):
+            yield TextLine(element, self.xmlns)
+
+    @property
+    def text_lines(self) -> List['TextLine']:
+        return list(self.iter_text_lines())
+
+    @property
+    def lines_text(self) -> str:
+        """ Text of all the lines, joined by a space, as in OverlayXML.get_regions_text. """
+        return ' '.join(text_line.text for text_line in self.iter_text_lines())
+
+
+class TextLine(_TextElementProxy):
+    __slots__ = ()
+
+    def iter_words(self) -> Iterator['Word']:
+        for element in self.element.iterfind(self._tag('Word')):
+            yield Word(element, self.xmlns)
+
+    @property
+    def words(self) -> List['Word']:
+        return list(self.iter_words())
+
+    @property
+    def text_region(self) -> Optional[TextRegion]:
+        for element in self.element.iterancestors(self._tag('TextRegion')):
+            return TextRegion(element, self.xmlns)
+        return None
+
+    @property
+    def trans_unit(self) -> Optional['TransUnit']:
+        """ The trans-unit of multilingual Page XML, None if not available. """
+
+        element = self.element.find(f'{self._tag("TextEquiv")}/{self._tag("trans-unit")}')
+        return TransUnit(element, self.xmlns) if element is not None else None
+
+    @property
+    def targets(self) -> Dict[str, str]:
+        """ Translations of the text line per language, empty if not multilingual. """
+
+        trans_unit = self.trans_unit
+        return trans_unit.targets if trans_unit is not None else {}
+
+
+class Word(_TextElementProxy):
+    __slots__ = ()
+
+
+class TransUnit(_ElementProxy):
+    """
+    XLIFF trans-unit inside the TextEquiv of a text line of multilingual Page XML.
+    """
+
+    __slots__ = ()
+
+    @property
+    def text_line(self) -> Optional[TextLine]:
+        for element in self.element.iterancestors(self._tag('TextLine')):
+            return TextLine(element, self.xmlns)
+        return None
+
+    @property
+    def source(self) -> str:
+        source = self.element.find(self._tag('source'))
+        if source is None or not source.text:
+            return ''
+        return source.text
+
+    @source.setter
+    def source(self, value: str):
+        source = self.element.find(self._tag('source'))
+        if source is None:
+            source = etree.Element(self._tag('source'))
+            self.element.insert(0, source)
+
+        source.text = value
+
+    @property
+    def source_lang(self) -> Optional[str]:
+        source = self.element.find(self._tag('source'))
+        return source.get(_TAG_LANG) if source is not None else None
+
+    @property
+    def targets(self) -> Dict[str, str]:
+        """ Target text per language. """
+        return {target.get(_TAG_LANG): target.text or '' for target in self.element.iterfind(self._tag('target'))}
+
+    def get_target(self, lang: str) -> Optional[str]:
+        target = self._find_target(lang)
+        if target is None:
+            return None
+        return target.text or ''
+
+    def set_target(self, lang: str, text: str):
+        """ Add or replace the target text in a language. """
+
+        target = self._find_target(lang)
+        if target is None:
+            target = etree.SubElement(self.element, self._tag('target'), {_TAG_LANG: lang})
+
+        target.text = text
+
+    def _find_target(self, lang) -> Optional[etree.ElementBase]:
+        for target in self.element.iterfind(self._tag('target')):
+            if target.get(_TAG_LANG) == lang:
+                return target
+        return None
@@ -0,0 +1,378 @@
+"""
+Evaluate an OCR transcription against a reference (e.g. gold standard) transcription.
+
+# Examples on how to use.
+>> score = evaluate_page(PageXML('PATH_TO_GOLD_STANDARD'), PageXML('PATH_TO_PERO_OCR'))
+>> score.page.cer, score.page.wer
+>> score.regions['REGION_ID'].cer
+
+>> corpus = evaluate_corpus([('PATH_TO_GOLD_STANDARD', 'PATH_TO_PERO_OCR'), ...])
+>> corpus.corpus.cer
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from lxml import etree
+
+from .alto import ALTO_NAMESPACES
+from .elements import TextLine
+from .orm import ALTOXML, OverlayXML, PageXML
+
+
+class Line:
+    """
+    A text line with the information needed to align it with another transcription.
+    """
+
+    __slots__ = ('id', 'region_id', 'bbox', 'text')
+
+    def __init__(self, id: Optional[str], region_id: Optional[str], bbox: Optional[Tuple[float, float, float, float]],
+                 text: str):
+        """
+
+        :param id: id of the text line.
+        :param region_id: id of the text region it belongs to.
+        :param bbox: bounding box (x0, y0, x1, y1), None if no geometry is available.
+        :param text: transcription of the line.
+        """
+        self.id = id
+        self.region_id = region_id
+        self.bbox = bbox
+        self.text = text
+
+
+class Score:
+    """
+    Edit distances and reference lengths, for both characters and words.
+    Scores are added, such that CER/WER are micro-averaged over lines, regions and pages.
+    """
+
+    __slots__ = ('char_errors', 'char_total', 'word_errors', 'word_total')
+
+    def __init__(self, char_errors: int = 0, char_total: int = 0, word_errors: int = 0, word_total: int = 0):
+        self.char_errors = char_errors
+        self.char_total = char_total
+        self.word_errors = word_errors
+        self.word_total = word_total
+
+    def __add__(self, other: 'Score') -> 'Score':
+        return Score(self.char_errors + other.char_errors,
+                     self.char_total + other.char_total,
+                     self.word_errors + other.word_errors,
+                     self.word_total + other.word_total)
+
+    def __repr__(self):
+        return f'Score(cer={self.cer:.4f}, wer={self.wer:.4f})'
+
+    @property
+    def cer(self) -> float:
+        """ Character error rate. NaN if there are no reference characters. """
+        return _safe_ratio(self.char_errors, self.char_total)
+
+    @property
+    def wer(self) -> float:
+        """ Word error rate. NaN if there are no reference words. """
+        return _safe_ratio(self.word_errors, self.word_total)
+
+
+class PageEvaluation:
+    """
+    Scores of a single page, both for the whole page and per reference region.
+    Hypothesis lines that couldn't be aligned are only counted on page level.
+    """
+
+    def __init__(self, page: Score, regions: Dict[Optional[str], Score], n_aligned: int):
+        self.page = page
+        self.regions = regions
+        self.n_aligned = n_aligned
+
+
+class CorpusEvaluation:
+    def __init__(self, pages: List[PageEvaluation]):
+        self.pages = pages
+        self.corpus = sum((page.page for page in pages), Score())
+
+
+def levenshtein(a: Sequence, b: Sequence) -> int:
+    """ Edit distance between two sequences, e.g. strings or lists of words.
+
+    Bit-parallel algorithm of Myers (1999) as formulated by Hyyrö (2003) for the global edit distance.
+    Python integers are used as bit vectors, such that there is no limit on the length.
+
+    :return:
+        Number of insertions, deletions and substitutions to go from a to b.
+    """
+
+    m = len(a)
+    if not m:
+        return len(b)
+    if not len(b):
+        return m
+
+    peq = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+
+    pv = full
+    mv = 0
+    score = m
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+
+    return score
+
+
+def score_lines(l_pairs: Iterable[Tuple[str, str]]) -> List[Score]:
+    """ Score a batch of (reference, hypothesis) text pairs.
+
+    :return:
+        a Score per pair.
+    """
+
+    l_score = []
+    for text_ref, text_hyp in l_pairs:
+        words_ref = text_ref.split()
+        words_hyp = text_hyp.split()
+
+        l_score.append(Score(char_errors=levenshtein(text_ref, text_hyp),
+                             char_total=len(text_ref),
+                             word_errors=levenshtein(words_ref, words_hyp),
+                             word_total=len(words_ref)))
+    return l_score
+
+
+def get_lines(xml: OverlayXML) -> List[Line]:
+    """ Get all the text lines, with their id, region and geometry.
+
+    :param xml: PageXML (or subclass) or ALTOXML
+    :return:
+        list of Line
+    """
+
+    if isinstance(xml, ALTOXML):
+        return _get_lines_alto(xml)
+    elif isinstance(xml, PageXML):
+        return _get_lines_page(xml)
+    else:
+        raise TypeError(f'Unsupported xml: {type(xml)}')
+
+
+def align_lines(l_lines_ref: List[Line], l_lines_hyp: List[Line], min_iou: float = .5) \
+        -> List[Tuple[Optional[Line], Optional[Line]]]:
+    """ Align the lines of two transcriptions.
+
+    Lines are first aligned by id. The remaining lines are aligned greedily on overlap of their bounding boxes.
+
+    :param l_lines_ref: reference lines.
+    :param l_lines_hyp: hypothesis lines.
+    :param min_iou: minimal intersection over union of the bounding boxes to align two lines.
+    :return:
+        list of (reference line, hypothesis line) pairs.
+        Lines without counterpart are paired with None.
+    """
+
+    d_hyp_id = {line.id: i for i, line in enumerate(l_lines_hyp) if line.id is not None}
+
+    l_pairs = []
+    b_hyp_aligned = np.zeros(len(l_lines_hyp), dtype=bool)
+    l_ref_left = []
+    for line_ref in l_lines_ref:
+        i_hyp = d_hyp_id.get(line_ref.id)
+        if i_hyp is not None and not b_hyp_aligned[i_hyp]:
+            b_hyp_aligned[i_hyp] = True
+            l_pairs.append((line_ref, l_lines_hyp[i_hyp]))
+        else:
+            l_ref_left.append(line_ref)
+
+    l_ref_geo = [line for line in l_ref_left if line.bbox is not None]
+    l_hyp_geo = [line for line, b in zip(l_lines_hyp, b_hyp_aligned) if not b and line.bbox is not None]
+
+    b_ref_geo_aligned = np.zeros(len(l_ref_geo), dtype=bool)
+    b_hyp_geo_aligned = np.zeros(len(l_hyp_geo), dtype=bool)
+    if l_ref_geo and l_hyp_geo:
+        iou = _iou_matrix(np.array([line.bbox for line in l_ref_geo], dtype=float),
+                          np.array([line.bbox for line in l_hyp_geo], dtype=float))
+
+        # Greedy: best overlapping pairs first.
+        i_ref, i_hyp = np.nonzero(iou >= min_iou)
+        for k in np.argsort(-iou[i_ref, i_hyp], kind='stable'):
+            r, h = i_ref[k], i_hyp[k]
+            if b_ref_geo_aligned[r] or b_hyp_geo_aligned[h]:
+                continue
+            b_ref_geo_aligned[r] = b_hyp_geo_aligned[h] = True
+            l_pairs.append((l_ref_geo[r], l_hyp_geo[h]))
+
+    l_ref_geo_left = {id(line) for line, b in zip(l_ref_geo, b_ref_geo_aligned) if not b}
+    l_pairs.extend((line, None) for line in l_ref_left if line.bbox is None or id(line) in l_ref_geo_left)
+
+    l_hyp_geo_left = {id(line) for line, b in zip(l_hyp_geo, b_hyp_geo_aligned) if not b}
+    l_pairs.extend((None, line) for line, b in zip(l_lines_hyp, b_hyp_aligned)
+                   if not b and (line.bbox is None or id(line) in l_hyp_geo_left))
+
+    return l_pairs
+
+
+def evaluate_page(xml_ref: OverlayXML, xml_hyp: OverlayXML, min_iou: float = .5) -> PageEvaluation:
+    """ Compute CER/WER of a hypothesis against a reference page.
+
+    Reference lines without counterpart count as deletions, hypothesis lines without counterpart as insertions.
+
+    :param xml_ref: reference, e.g. gold standard, PageXML or ALTOXML.
+    :param xml_hyp: hypothesis, e.g. OCR output, PageXML or ALTOXML.
+    :param min_iou: see align_lines.
+    :return:
+        PageEvaluation
+    """
+
+    l_pairs = align_lines(get_lines(xml_ref), get_lines(xml_hyp), min_iou=min_iou)
+
+    l_score = score_lines((line_ref.text if line_ref else '',
+                           line_hyp.text if line_hyp else '') for line_ref, line_hyp in l_pairs)
+
+    page = Score()
+    regions = {}
+    for (line_ref, _), score in zip(l_pairs, l_score):
+        page += score
+        if line_ref is not None:
+            regions[line_ref.region_id] = regions.get(line_ref.region_id, Score()) + score
+
+    n_aligned = sum(line_ref is not None and line_hyp is not None for line_ref, line_hyp in l_pairs)
+
+    return PageEvaluation(page=page, regions=regions, n_aligned=n_aligned)
+
+
+def evaluate_files(filename_ref: str, filename_hyp: str, min_iou: float = .5) -> PageEvaluation:
+    """ evaluate_page for files, Page XML or ALTO is detected automatically. """
+    return evaluate_page(open_overlay_xml(filename_ref), open_overlay_xml(filename_hyp), min_iou=min_iou)
+
+
+def evaluate_corpus(l_filenames: Iterable[Tuple[str, str]], min_iou: float = .5, max_workers: Optional[int] = None) \
+        -> CorpusEvaluation:
+    """ Evaluate a corpus of (reference, hypothesis) file pairs, with the pages processed in parallel.
+
+    :param l_filenames: (reference filename, hypothesis filename) per page.
+    :param min_iou: see align_lines.
+    :param max_workers: number of processes. If 1, everything is done in the current process.
+    :return:
+        CorpusEvaluation with the scores per page (in the same order) and for the whole corpus.
+    """
+
+    l_filenames = list(l_filenames)
+    l_ref = [filename_ref for filename_ref, _ in l_filenames]
+    l_hyp = [filename_hyp for _, filename_hyp in l_filenames]
+    l_min_iou = [min_iou] * len(l_filenames)
+
+    if max_workers == 1 or len(l_filenames) <= 1:
+        return CorpusEvaluation(list(map(evaluate_files, l_ref, l_hyp, l_min_iou)))
+
+    if max_workers is None:
+        max_workers = min(len(l_filenames), os.cpu_count() or 1)
+
+    chunksize = max(1, len(l_filenames) // (4 * max_workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        l_pages = list(executor.map(evaluate_files, l_ref, l_hyp, l_min_iou, chunksize=chunksize))
+
+    return CorpusEvaluation(l_pages)
+
+
+def open_overlay_xml(filename) -> OverlayXML:
+    """ Open as ALTOXML or PageXML, based on the namespace of the root. """
+
+    for _, root in etree.iterparse(filename, events=('start',)):
+        xmlns = root.tag.split('}')[0].strip('{')
+        break
+    else:
+        raise ValueError(f'Empty xml: {filename}')
+
+    if xmlns in ALTO_NAMESPACES.values():
+        return ALTOXML(filename)
+    return PageXML(filename)
+
+
+def _get_lines_page(xml: PageXML) -> List[Line]:
+    l_lines = []
+    for region in xml.iter_text_regions():
+        region_id = region.id
+        for text_line in region.iter_text_lines():
+            l_lines.append(Line(text_line.id, region_id, _get_bbox(text_line), text_line.text))
+
+    return l_lines
+
+
+def _get_lines_alto(xml: ALTOXML) -> List[Line]:
+    xmlns = xml.element_tree.getroot().tag.split('}')[0].strip('{')
+    if xmlns not in ALTO_NAMESPACES.values():
+        raise TypeError('Not a valid ALTO file (namespace declaration missing)')
+
+    l_lines = []
+    for region in xml.element_tree.iterfind('.//{%s}TextBlock' % xmlns):
+        region_id = region.get('ID')
+        for text_line in region.iterfind('.//{%s}TextLine' % xmlns):
+            try:
+                x0 = float(text_line.get('HPOS'))
+                y0 = float(text_line.get('VPOS'))
+                bbox = (x0, y0, x0 + float(text_line.get('WIDTH')), y0 + float(text_line.get('HEIGHT')))
+            except (TypeError, ValueError):  # Missing or invalid geometry
+                bbox = None
+
+            text = ' '.join(string.get('CONTENT', '') for string in text_line.iterfind('{%s}String' % xmlns))
+
+            l_lines.append(Line(text_line.get('ID'), region_id, bbox, text))
+
+    return l_lines
+
+
+def _get_bbox(text_line: TextLine) -> Optional[Tuple[float, float, float, float]]:
+    try:
+        coords = text_line.coords
+        if not coords:
+            return None
+
+        xy = np.array(coords, dtype=float)
+        x0, y0 = xy.min(axis=0)
+        x1, y1 = xy.max(axis=0)
+    except (ValueError, IndexError):  # Malformed points
+        return None
+
+    return x0, y0, x1, y1
+
+
+def _iou_matrix(bbox_a: np.ndarray, bbox_b: np.ndarray) -> np.ndarray:
+    """ Intersection over union between all the (x0, y0, x1, y1) boxes of a (n x 4) and b (m x 4). """
+
+    x0 = np.maximum(bbox_a[:, None, 0], bbox_b[None, :, 0])
+    y0 = np.maximum(bbox_a[:, None, 1], bbox_b[None, :, 1])
+    x1 = np.minimum(bbox_a[:, None, 2], bbox_b[None, :, 2])
+    y1 = np.minimum(bbox_a[:, None, 3], bbox_b[None, :, 3])
+
+    intersection = np.clip(x1 - x0, 0, None) * np.clip(y1 - y0, 0, None)
+
+    area_a = (bbox_a[:, 2] - bbox_a[:, 0]) * (bbox_a[:, 3] - bbox_a[:, 1])
+    area_b = (bbox_b[:, 2] - bbox_b[:, 0]) * (bbox_b[:, 3] - bbox_b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - intersection
+
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def _safe_ratio(numerator, denominator) -> float:
+    return numerator / denominator if denominator else float('nan')
@@ -9,16 +9,17 @@ import os
 import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterator, List
 
 from lxml import etree
 
-from .xml.xml_shared import _change_namespace
+from .alto import ALTO_NAMESPACES, ALTOWords
+from .elements import TextLine, TextRegion, TransUnit
+from .xml.xml_shared import XML_NAMESPACE, _change_namespace, _get_tag
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 FILENAME_XSD_PAGE = os.path.join(ROOT, 'xml_orm/xml_schema/pagecontent_2013_07_15.xsd')
 FILENAME_XSD_MULTILINGUAL_PAGE = os.path.join(ROOT, 'xml_orm/xml_schema/multilingual_pagecontent_v0_3.xsd')
-XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 for filename in FILENAME_XSD_PAGE, FILENAME_XSD_MULTILINGUAL_PAGE:
     if not os.path.exists(filename):
@@ -216,6 +217,18 @@ class PageXML(OverlayXML):
 
         return l_text_page
 
+    def iter_text_regions(self) -> Iterator[TextRegion]:
+        """ Lazily iterate over the text regions, as objects on top of the underlying elements.
+        """
+        xmlns = self.get_xmlns()
+        for region in self.element_tree.iterfind('.//{%s}TextRegion' % xmlns):
+            yield TextRegion(region, xmlns)
+
+    def iter_text_lines(self) -> Iterator[TextLine]:
+        xmlns = self.get_xmlns()
+        for text_line in self.element_tree.iterfind('.//{%s}TextLine' % xmlns):
+            yield TextLine(text_line, xmlns)
+
 
 class ALTOXML(OverlayXML):
     def get_regions_lines_text(self) -> List[List[str]]:
@@ -227,12 +240,9 @@ class ALTOXML(OverlayXML):
              with list of all the text lines in it.
         """
 
-        namespace = {'alto-1': 'http://schema.ccs-gmbh.com/ALTO',
-                     'alto-2': 'http://www.loc.gov/standards/alto/ns-v2#',
-                     'alto-3': 'http://www.loc.gov/standards/alto/ns-v3#'}
         # tree = ET.parse(sys.argv[1])
         xmlns = self.element_tree.getroot().tag.split('}')[0].strip('{')
-        if xmlns in namespace.values():
+        if xmlns in ALTO_NAMESPACES.values():
 
             l_text_page = []
 
@@ -260,6 +270,20 @@ class ALTOXML(OverlayXML):
 
         return l_text_page
 
+    def get_words(self, page: int = 0) -> ALTOWords:
+        """ Get all the words (String elements) with their coordinates and confidence as NumPy arrays.
+
+        :param page: page index to assign to the words.
+        :return:
+            ALTOWords, a columnar view to filter and aggregate the words without Python loops.
+        """
+
+        xmlns = self.element_tree.getroot().tag.split('}')[0].strip('{')
+        if xmlns not in ALTO_NAMESPACES.values():
+            raise TypeError('Not a valid ALTO file (namespace declaration missing)')
+
+        return ALTOWords.from_element_tree(self.element_tree, xmlns, page=page)
+
 
 class XLIFFPageXML(PageXML):
     """
@@ -340,6 +364,27 @@ class XLIFFPageXML(PageXML):
 
         return
 
+    def set_targets(self, d_target_text: Dict[str, str], lang_target):
+        """
+        Add or replace the target of other languages, by the id of the trans-unit.
+
+        :param d_target_text: translated text per trans-unit id. Unknown ids are ignored.
+        :param lang_target: language of the translation.
+        :return:
+        """
+
+        for trans_unit in self.iter_trans_units():
+            target_text = d_target_text.get(trans_unit.id)
+            if target_text is not None:
+                trans_unit.set_target(lang_target, target_text)
+
+        return
+
+    def iter_trans_units(self) -> Iterator[TransUnit]:
+        xmlns = self.get_xmlns()
+        for trans_unit in self.element_tree.iter(_get_tag("trans-unit", xmlns)):
+            yield TransUnit(trans_unit, xmlns)
+
     def validate(self):
 
         # TODO make this load
@@ -366,6 +411,3 @@ class XLIFFPageXML(PageXML):
             print('Unknown error, exiting.')
             raise e
 
-
-def _get_tag(tag, namespace):
-    return f'{{{namespace}}}{tag}'
@@ -0,0 +1,123 @@
+import os
+import unittest
+
+import numpy as np
+
+from xml_orm.alto import ALTOWords
+from xml_orm.orm import ALTOXML
+
+ROOT_TEST = os.path.join(os.path.dirname(__file__))
+
+FILENAME_ALTO = os.path.join(ROOT_TEST, 'example_files/alto/KB_JB840_1919-04-01_01-00001.xml')
+FILENAME_PAGE_XML = os.path.join(ROOT_TEST, 'example_files/KB_JB840_1919-04-01_01_0_fixed.xml')
+
+
+class TestALTOWords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.alto_xml = ALTOXML(FILENAME_ALTO)
+        self.words = self.alto_xml.get_words()
+
+    def test_columns(self):
+        n = len(self.words)
+
+        self.assertEqual(n, len(self.words.get_words_text()))
+
+        for a in (self.words.hpos,
+                  self.words.vpos,
+                  self.words.width,
+                  self.words.height,
+                  self.words.confidence,
+                  self.words.page,
+                  self.words.block,
+                  self.words.line):
+            with self.subTest('Shape'):
+                self.assertEqual(a.shape, (n,))
+
+        with self.subTest('Coordinates'):
+            self.assertEqual(self.words.hpos[0], 204)
+            self.assertEqual(self.words.height[0], 43)
+
+        with self.subTest('Indices sorted'):
+            self.assertTrue(np.all(np.diff(self.words.line) >= 0))
+            self.assertTrue(np.all(np.diff(self.words.block) >= 0))
+
+    def test_lines_text(self):
+        self.assertListEqual(self.alto_xml.get_lines_text(), self.words.get_lines_text())
+
+    def test_lines_filtered(self):
+        """ Text and confidence of the lines should pair up after filtering words. """
+
+        words_filtered = self.words.filter_confidence(.9)
+
+        l_lines_text = words_filtered.get_lines_text()
+        lines_confidence = words_filtered.get_lines_confidence()
+
+        self.assertEqual(len(lines_confidence), len(l_lines_text))
+        for text_line, confidence in zip(l_lines_text, lines_confidence):
+            self.assertEqual(text_line == '', np.isnan(confidence))
+
+    def test_invalid_attributes(self):
+        string = next(self.alto_xml.element_tree.iter('{*}String'))
+        string.set('HPOS', '12.5px')
+        string.set('WC', 'abc')
+
+        words = self.alto_xml.get_words()
+
+        self.assertTrue(np.isnan(words.hpos[0]))
+        self.assertTrue(np.isnan(words.confidence[0]))
+        self.assertEqual(self.words.vpos[0], words.vpos[0])
+        self.assertEqual(self.words.hpos[1], words.hpos[1])
+
+    def test_filter_confidence(self):
+        threshold = .5
+        words_filtered = self.words.filter_confidence(threshold)
+
+        l_expected = [text for text, confidence in zip(self.words.get_words_text(), self.words.confidence)
+                      if confidence >= threshold]
+
+        self.assertListEqual(l_expected, words_filtered.get_words_text())
+        self.assertTrue(np.all(words_filtered.confidence >= threshold))
+
+    def test_lines_confidence(self):
+        lines_confidence = self.words.get_lines_confidence()
+
+        i_line = self.words.line[0]
+        expected = self.words.confidence[self.words.line == i_line].mean()
+
+        self.assertAlmostEqual(expected, lines_confidence[i_line])
+
+    def test_concatenate(self):
+        words_pages = ALTOWords.concatenate([self.words, self.words])
+
+        with self.subTest('Length'):
+            self.assertEqual(2 * len(self.words), len(words_pages))
+
+        with self.subTest('Unique indices'):
+            self.assertEqual(words_pages.page.max(), 1)
+            self.assertEqual(words_pages.line.max() + 1, 2 * (self.words.line.max() + 1))
+
+        with self.subTest('Text'):
+            self.assertListEqual(2 * self.words.get_lines_text(), words_pages.get_lines_text())
+
+    def test_concatenate_page(self):
+        l_words = [self.alto_xml.get_words(page=i) for i in range(3)]
+
+        words_pages = ALTOWords.concatenate(l_words)
+        self.assertListEqual([0, 1, 2], np.unique(words_pages.page).tolist())
+
+        words_pages = ALTOWords.concatenate([words_pages, self.alto_xml.get_words(page=3)])
+        self.assertListEqual([0, 1, 2, 3], np.unique(words_pages.page).tolist())
+
+    def test_getitem(self):
+        with self.subTest('Scalar'):
+            word = self.words[1]
+            self.assertEqual(1, len(word))
+            self.assertListEqual(self.words.get_words_text()[1:2], word.get_words_text())
+
+        with self.subTest('Document order'):
+            self.assertListEqual(self.words.get_lines_text(), self.words[::-1].get_lines_text())
+            self.assertListEqual(self.words[[1, 2]].get_words_text(), self.words[[2, 1]].get_words_text())
+
+    def test_non_alto(self):
+        with self.assertRaises(TypeError):
+            ALTOXML(FILENAME_PAGE_XML).get_words()
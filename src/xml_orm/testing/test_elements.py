@@ -0,0 +1,96 @@
+import os
+import unittest
+
+from lxml import etree
+
+from xml_orm.elements import TextLine, TextRegion, TransUnit
+from xml_orm.orm import PageXML, XLIFFPageXML
+
+ROOT_TEST = os.path.join(os.path.dirname(__file__))
+
+FILENAME_PAGE_XML = os.path.join(ROOT_TEST, 'example_files/KB_JB840_1919-04-01_01_0_fixed.xml')
+
+
+class TestElements(unittest.TestCase):
+    def setUp(self) -> None:
+        self.page_xml = PageXML(FILENAME_PAGE_XML)
+
+    def test_slots(self):
+        text_line = next(self.page_xml.iter_text_lines())
+
+        self.assertIsInstance(text_line, TextLine)
+        with self.assertRaises(AttributeError):
+            text_line.foo = 'bar'
+
+    def test_text(self):
+        l_regions = list(self.page_xml.iter_text_regions())
+
+        with self.subTest('Regions'):
+            self.assertIsInstance(l_regions[0], TextRegion)
+            self.assertListEqual(self.page_xml.get_regions_text(), [region.lines_text for region in l_regions])
+
+        with self.subTest('Lines'):
+            self.assertListEqual(self.page_xml.get_lines_text(),
+                                 [text_line.text for text_line in self.page_xml.iter_text_lines()])
+
+    def test_attributes(self):
+        text_line = next(self.page_xml.iter_text_lines())
+
+        self.assertEqual('d393e17a-ad27-4c49-bcbf-1961a48af93e', text_line.id)
+        self.assertEqual((305, 132), text_line.coords[0])
+        self.assertEqual('f96ze8c0-54ef-4590-bfe2-140e7e238576', text_line.text_region.id)
+        self.assertIsNone(text_line.trans_unit)
+        self.assertDictEqual({}, text_line.targets)
+
+    def test_write_back(self):
+        text_line = next(self.page_xml.iter_text_lines())
+
+        text_line.text = 'trouw deze!'
+        text_line.coords = [(0, 0), (10, 0), (10, 10)]
+        text_line.language = 'Dutch'
+
+        text_line = next(self.page_xml.iter_text_lines())
+        self.assertEqual('trouw deze!', text_line.text)
+        self.assertEqual('trouw deze!', self.page_xml.get_lines_text()[0])
+        self.assertListEqual([(0, 0), (10, 0), (10, 10)], text_line.coords)
+        self.assertEqual('Dutch', text_line.language)
+
+    def test_write_back_region(self):
+        region = next(self.page_xml.iter_text_regions())
+        etree.SubElement(region.element, '{%s}TextStyle' % region.xmlns)
+
+        region.text = 'trouw deze Vederlanders'
+
+        region = next(self.page_xml.iter_text_regions())
+        self.assertEqual('trouw deze Vederlanders', region.text)
+        self.assertNotEqual(region.text, region.lines_text)
+
+        with self.subTest('Schema order'):
+            l_tags = [etree.QName(child).localname for child in region.element]
+            self.assertListEqual(['TextLine', 'TextEquiv', 'TextStyle'], l_tags[-3:])
+
+    def test_trans_units(self):
+        xml = XLIFFPageXML.from_page(FILENAME_PAGE_XML, source_lang='nl')
+
+        l_trans_units = list(xml.iter_trans_units())
+        trans_unit = l_trans_units[0]
+
+        with self.subTest('Source'):
+            self.assertIsInstance(trans_unit, TransUnit)
+            self.assertEqual('r000-l000', trans_unit.id)
+            self.assertEqual('nl', trans_unit.source_lang)
+            self.assertEqual('trouw deze', trans_unit.source)
+
+        with self.subTest('Targets'):
+            self.assertIsNone(trans_unit.get_target('en'))
+
+            trans_unit.set_target('en', 'loyal this')
+            trans_unit.set_target('en', 'loyal these')
+            trans_unit.set_target('fr', 'fidèle')
+
+            self.assertDictEqual({'en': 'loyal these', 'fr': 'fidèle'}, trans_unit.targets)
+            self.assertDictEqual(trans_unit.targets, trans_unit.text_line.targets)
+
+        with self.subTest('Set targets by id'):
+            xml.set_targets({trans_unit.id: 'loyal'}, 'en')
+            self.assertEqual('loyal', next(xml.iter_trans_units()).get_target('en'))
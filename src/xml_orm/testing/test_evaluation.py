@@ -0,0 +1,135 @@
+import math
+import os
+import unittest
+
+from xml_orm.evaluation import align_lines, evaluate_corpus, evaluate_page, get_lines, levenshtein, Line
+from xml_orm.orm import ALTOXML, PageXML
+
+ROOT_TEST = os.path.join(os.path.dirname(__file__))
+
+FILENAME_PAGE_XML = os.path.join(ROOT_TEST, 'example_files/KB_JB840_1919-04-01_01_0_fixed.xml')
+FILENAME_PAGE_XML_NONVALID = os.path.join(ROOT_TEST, 'example_files/KB_JB840_1919-04-01_01_0.xml')
+FILENAME_ALTO = os.path.join(ROOT_TEST, 'example_files/alto/KB_JB840_1919-04-01_01-00001.xml')
+
+
+def _levenshtein_reference(a, b):
+    prev = list(range(len(b) + 1))
+    for i, c_a in enumerate(a, 1):
+        cur = [i]
+        for j, c_b in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (c_a != c_b)))
+        prev = cur
+    return prev[-1]
+
+
+class TestLevenshtein(unittest.TestCase):
+    def test_examples(self):
+        for a, b in [('', ''),
+                     ('', 'abc'),
+                     ('kitten', 'sitting'),
+                     ('Vederlanders', 'Vsderiandf'),
+                     ('a' * 100, 'a' * 99 + 'b'),
+                     ('trouw deze', 'tronw deze niet'),
+                     ]:
+            with self.subTest(a=a, b=b):
+                self.assertEqual(_levenshtein_reference(a, b), levenshtein(a, b))
+                self.assertEqual(levenshtein(a, b), levenshtein(b, a))
+
+    def test_words(self):
+        self.assertEqual(1, levenshtein('trouw deze'.split(), 'tronw deze'.split()))
+
+
+class TestAlign(unittest.TestCase):
+    def test_id(self):
+        l_lines_ref = [Line('a', 'r', None, 'x'), Line('b', 'r', None, 'y')]
+        l_lines_hyp = [Line('b', 'r', None, 'y'), Line('c', 'r', None, 'z')]
+
+        l_pairs = align_lines(l_lines_ref, l_lines_hyp)
+
+        l_pairs_id = [(line_ref and line_ref.id, line_hyp and line_hyp.id) for line_ref, line_hyp in l_pairs]
+        self.assertListEqual([('b', 'b'), ('a', None), (None, 'c')], l_pairs_id)
+
+    def test_geometry(self):
+        l_lines_ref = [Line('a', 'r', (0, 0, 10, 10), 'x'), Line('b', 'r', (0, 20, 10, 30), 'y')]
+        l_lines_hyp = [Line('1', 'r', (1, 21, 10, 30), 'y'), Line('2', 'r', (0, 1, 10, 11), 'x')]
+
+        l_pairs = align_lines(l_lines_ref, l_lines_hyp)
+
+        self.assertEqual(2, len(l_pairs))
+        for line_ref, line_hyp in l_pairs:
+            self.assertEqual(line_ref.text, line_hyp.text)
+
+
+class TestEvaluate(unittest.TestCase):
+    def test_identical(self):
+        page_xml = PageXML(FILENAME_PAGE_XML)
+
+        evaluation = evaluate_page(page_xml, page_xml)
+
+        self.assertEqual(0, evaluation.page.cer)
+        self.assertEqual(0, evaluation.page.wer)
+        self.assertEqual(len(get_lines(page_xml)), evaluation.n_aligned)
+
+    def test_different_ids(self):
+        """ Part of the ids are changed by the auto fix. """
+
+        evaluation = evaluate_page(PageXML(FILENAME_PAGE_XML_NONVALID), PageXML(FILENAME_PAGE_XML))
+
+        self.assertEqual(0, evaluation.page.cer)
+
+    def test_geometry(self):
+        """ Without ids, all the lines should be aligned on geometry. """
+
+        l_lines_ref = get_lines(PageXML(FILENAME_PAGE_XML_NONVALID))
+        l_lines_hyp = get_lines(PageXML(FILENAME_PAGE_XML))
+        for line in l_lines_ref + l_lines_hyp:
+            line.id = None
+
+        l_pairs = align_lines(l_lines_ref, l_lines_hyp)
+
+        self.assertEqual(len(l_lines_ref), len(l_pairs))
+        for line_ref, line_hyp in l_pairs:
+            self.assertIsNotNone(line_ref)
+            self.assertIsNotNone(line_hyp)
+            self.assertEqual(line_ref.text, line_hyp.text)
+
+    def test_invalid_geometry(self):
+        alto_xml = ALTOXML(FILENAME_ALTO)
+        text_line = next(alto_xml.element_tree.iter('{*}TextLine'))
+        text_line.set('HPOS', 'abc')
+
+        self.assertIsNone(get_lines(alto_xml)[0].bbox)
+
+    def test_invalid_points(self):
+        page_xml = PageXML(FILENAME_PAGE_XML)
+        l_coords = list(page_xml.element_tree.iter('{%s}Coords' % page_xml.get_xmlns()))
+        l_coords[1].set('points', '1,2 3')
+        l_coords[2].set('points', '1,2 a,4')
+
+        l_lines = get_lines(page_xml)
+        self.assertIsNone(l_lines[0].bbox)
+        self.assertIsNone(l_lines[1].bbox)
+
+        self.assertEqual(0, evaluate_page(page_xml, page_xml).page.cer)
+
+    def test_page_alto(self):
+        evaluation = evaluate_page(PageXML(FILENAME_PAGE_XML), ALTOXML(FILENAME_ALTO))
+
+        with self.subTest('Scores'):
+            self.assertGreater(evaluation.page.cer, 0)
+            self.assertFalse(math.isnan(evaluation.page.wer))
+
+        with self.subTest('Regions sum to page'):
+            self.assertLessEqual(sum(score.char_total for score in evaluation.regions.values()),
+                                 evaluation.page.char_total)
+
+    def test_corpus(self):
+        l_filenames = [(FILENAME_PAGE_XML, FILENAME_ALTO),
+                       (FILENAME_PAGE_XML, FILENAME_PAGE_XML)]
+
+        corpus = evaluate_corpus(l_filenames, max_workers=2)
+        corpus_serial = evaluate_corpus(l_filenames, max_workers=1)
+
+        self.assertEqual(corpus_serial.corpus.char_errors, corpus.corpus.char_errors)
+        self.assertEqual(corpus.pages[0].page.char_errors, corpus.corpus.char_errors)
+        self.assertEqual(0, corpus.pages[1].page.char_errors)
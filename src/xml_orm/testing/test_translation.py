@@ -0,0 +1,128 @@
+import asyncio
+import os
+import unittest
+from typing import List
+
+from xml_orm.orm import XLIFFPageXML
+from xml_orm.translation import EchoBackend, TranslationBackend, TranslationDriver
+
+ROOT_TEST = os.path.join(os.path.dirname(__file__))
+
+FILENAME_PAGE_XML = os.path.join(ROOT_TEST, 'example_files/KB_JB840_1919-04-01_01_0_fixed.xml')
+
+
+class FlakyBackend(EchoBackend):
+    """ Fails every other request. """
+
+    def __init__(self):
+        super(FlakyBackend, self).__init__(prefix='EN: ')
+        self.n_requests = 0
+
+    async def translate(self, l_text: List[str], source_lang: str, target_lang: str) -> List[str]:
+        self.n_requests += 1
+        if self.n_requests % 2:
+            raise ConnectionError('Translation service unavailable.')
+
+        return await super(FlakyBackend, self).translate(l_text, source_lang, target_lang)
+
+
+class FailingBackend(TranslationBackend):
+    async def translate(self, l_text: List[str], source_lang: str, target_lang: str) -> List[str]:
+        raise ConnectionError('Translation service unavailable.')
+
+
+class ConcurrencyBackend(EchoBackend):
+    """ Keeps track of the number of concurrent requests. """
+
+    def __init__(self):
+        super(ConcurrencyBackend, self).__init__()
+        self.n_in_flight = 0
+        self.max_in_flight = 0
+
+    async def translate(self, l_text: List[str], source_lang: str, target_lang: str) -> List[str]:
+        self.n_in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.n_in_flight)
+        await asyncio.sleep(.001)
+        self.n_in_flight -= 1
+
+        return l_text
+
+
+class TestTranslationDriver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.l_xml = [XLIFFPageXML.from_page(FILENAME_PAGE_XML, source_lang='nl') for _ in range(2)]
+
+    def test_batches(self):
+        driver = TranslationDriver(EchoBackend(), max_chars=200, max_segments=10)
+
+        l_batches = list(driver.iter_batches(self.l_xml))
+
+        n_trans_units = sum(1 for xml in self.l_xml for trans_unit in xml.iter_trans_units() if trans_unit.source)
+        self.assertEqual(n_trans_units, sum(map(len, l_batches)))
+
+        for batch in l_batches:
+            self.assertLessEqual(len(batch), 10)
+            self.assertTrue(len(batch) == 1 or sum(len(trans_unit.source) for trans_unit in batch) <= 200)
+
+    def test_translate(self):
+        driver = TranslationDriver(EchoBackend(prefix='EN: '), max_chars=500, max_segments=20)
+
+        n = driver.translate(self.l_xml, source_lang='nl', target_lang='en')
+
+        self.assertGreater(n, 0)
+        for xml in self.l_xml:
+            for trans_unit in xml.iter_trans_units():
+                target = trans_unit.get_target('en')
+                if trans_unit.source:
+                    self.assertEqual('EN: ' + trans_unit.source, target)
+                else:
+                    self.assertEqual('', target)
+
+    def test_on_page_done(self):
+        l_done = []
+
+        def on_page_done(xml):
+            # All the trans-units should be translated at this point.
+            for trans_unit in xml.iter_trans_units():
+                self.assertIsNotNone(trans_unit.get_target('en'))
+            l_done.append(xml)
+
+        l_xml = (XLIFFPageXML.from_page(FILENAME_PAGE_XML, source_lang='nl') for _ in range(3))
+
+        driver = TranslationDriver(EchoBackend(), max_segments=30, max_in_flight=2)
+        driver.translate(l_xml, source_lang='nl', target_lang='en', on_page_done=on_page_done)
+
+        self.assertEqual(3, len(l_done))
+        self.assertEqual(3, len(set(map(id, l_done))))
+
+    def test_in_flight(self):
+        backend = ConcurrencyBackend()
+        driver = TranslationDriver(backend, max_segments=5, max_in_flight=3)
+
+        driver.translate(self.l_xml, source_lang='nl', target_lang='en')
+
+        self.assertEqual(3, backend.max_in_flight)
+
+    def test_retry(self):
+        backend = FlakyBackend()
+        driver = TranslationDriver(backend, max_segments=50, max_in_flight=1, retry_delay=0)
+
+        driver.translate(self.l_xml[:1], source_lang='nl', target_lang='en')
+
+        trans_unit = next(self.l_xml[0].iter_trans_units())
+        self.assertEqual('EN: ' + trans_unit.source, trans_unit.get_target('en'))
+
+    def test_invalid_arguments(self):
+        for kwargs in ({'max_chars': 0},
+                       {'max_segments': 0},
+                       {'max_in_flight': 0},
+                       {'max_retries': -1}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    TranslationDriver(EchoBackend(), **kwargs)
+
+    def test_fail(self):
+        driver = TranslationDriver(FailingBackend(), max_retries=2, retry_delay=0)
+
+        with self.assertRaises(ConnectionError):
+            driver.translate(self.l_xml, source_lang='nl', target_lang='en')
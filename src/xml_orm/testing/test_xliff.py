@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+
+from lxml import etree
+
+from xml_orm.orm import XLIFFPageXML
+from xml_orm.xliff import export_xliff, import_xliff, iter_xliff_files, XLIFF_NAMESPACES
+
+ROOT_TEST = os.path.join(os.path.dirname(__file__))
+
+FILENAME_PAGE_XML = os.path.join(ROOT_TEST, 'example_files/KB_JB840_1919-04-01_01_0_fixed.xml')
+
+
+def _translate(filename_xliff):
+    """ Mock translation: add a target with the upper case of the source. """
+
+    tree = etree.parse(filename_xliff)
+    xmlns = tree.getroot().nsmap.get(None)
+
+    for source in tree.iter('{%s}source' % xmlns):
+        target = etree.Element('{%s}target' % xmlns)
+        target.text = (source.text or '').upper()
+        source.addnext(target)
+
+    tree.write(filename_xliff)
+
+
+class TestXLIFF(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        xml = XLIFFPageXML.from_page(FILENAME_PAGE_XML, source_lang='nl')
+        self.n_trans_units = len(list(xml.element_tree.iter('{%s}trans-unit' % xml.get_xmlns())))
+
+        self.l_filenames_page = []
+        for i in range(3):
+            filename_page = os.path.join(self.tmp_dir.name, f'page_{i}.xml')
+            xml.write(filename_page)
+            self.l_filenames_page.append(filename_page)
+
+        self.filename_xliff = os.path.join(self.tmp_dir.name, 'volume.xlf')
+
+    def test_export(self):
+        for version in XLIFF_NAMESPACES:
+            with self.subTest(version=version):
+                export_xliff(self.filename_xliff, self.l_filenames_page, source_lang='nl', target_lang='en',
+                             version=version)
+
+                root = etree.parse(self.filename_xliff).getroot()
+                xmlns = XLIFF_NAMESPACES[version]
+
+                self.assertEqual(root.tag, '{%s}xliff' % xmlns)
+                self.assertEqual(len(self.l_filenames_page), len(root.findall('{%s}file' % xmlns)))
+                self.assertEqual(len(self.l_filenames_page) * self.n_trans_units,
+                                 len(list(root.iter('{%s}source' % xmlns))))
+
+    def test_round_trip(self):
+        for version in XLIFF_NAMESPACES:
+            with self.subTest(version=version):
+                export_xliff(self.filename_xliff, self.l_filenames_page, source_lang='nl', target_lang='en',
+                             version=version)
+                _translate(self.filename_xliff)
+
+                l_original = []
+                for original, xml in import_xliff(self.filename_xliff):
+                    l_original.append(original)
+
+                    xmlns = xml.get_xmlns()
+                    for trans_unit in xml.element_tree.iter('{%s}trans-unit' % xmlns):
+                        source = trans_unit.find('{%s}source' % xmlns)
+                        target = trans_unit.find('{%s}target' % xmlns)
+
+                        self.assertEqual((source.text or '').upper(), target.text)
+
+                self.assertListEqual([os.path.basename(filename) for filename in self.l_filenames_page], l_original)
+
+    def test_import_twice(self):
+        """ Importing again should replace the targets, not add new ones. """
+
+        export_xliff(self.filename_xliff, self.l_filenames_page[:1], source_lang='nl', target_lang='en')
+        _translate(self.filename_xliff)
+
+        for original, xml in import_xliff(self.filename_xliff):
+            xml.write(os.path.join(self.tmp_dir.name, original))
+
+        for original, xml in import_xliff(self.filename_xliff):
+            xmlns = xml.get_xmlns()
+            self.assertEqual(self.n_trans_units, len(list(xml.element_tree.iter('{%s}target' % xmlns))))
+
+    def test_inline_markup(self):
+        with open(self.filename_xliff, 'w') as f:
+            f.write(f"""<xliff xmlns="{XLIFF_NAMESPACES['1.2']}" version="1.2">
+<file original="page_0.xml" source-language="nl" target-language="en" datatype="plaintext"><body>
+<trans-unit id="r000-l000">
+<source>trouw deze</source>
+<target>marry <g id="1">this</g> now<x id="2"/></target>
+<alt-trans><target>alternative</target></alt-trans>
+</trans-unit>
+<trans-unit id="r000-l001">
+<source>Vederlanders niet die</source>
+<alt-trans><target>alternative</target></alt-trans>
+</trans-unit>
+</body></file></xliff>""")
+
+        for original, xml in import_xliff(self.filename_xliff):
+            l_trans_units = list(xml.iter_trans_units())
+
+            self.assertEqual('marry this now', l_trans_units[0].get_target('en'))
+            self.assertIsNone(l_trans_units[1].get_target('en'))
+
+    def test_inline_whitespace(self):
+        with open(self.filename_xliff, 'w') as f:
+            f.write(f"""<xliff xmlns="{XLIFF_NAMESPACES['1.2']}" version="1.2">
+<file original="page_0.xml" source-language="nl" target-language="en" datatype="plaintext"><body>
+<trans-unit id="r000-l000">
+<source>trouw deze</source>
+<target><g id="1">marry</g> <g id="2">this</g></target>
+</trans-unit>
+</body></file></xliff>""")
+
+        for original, xml in import_xliff(self.filename_xliff):
+            self.assertEqual('marry this', next(xml.iter_trans_units()).get_target('en'))
+
+    def test_segments(self):
+        with open(self.filename_xliff, 'w') as f:
+            f.write(f"""<xliff xmlns="{XLIFF_NAMESPACES['2.0']}" version="2.0" srcLang="nl" trgLang="en">
+<file id="f1" original="page_0.xml">
+<unit id="r000-l000">
+<segment><source>trouw.</source><target>marry.</target></segment>
+<ignorable><source> </source></ignorable>
+<segment><source>deze</source><target><pc id="1">this</pc></target></segment>
+</unit>
+</file></xliff>""")
+
+        for original, xml in import_xliff(self.filename_xliff):
+            self.assertEqual('marry. this', next(xml.iter_trans_units()).get_target('en'))
+
+    def test_iter_non_xliff(self):
+        with self.assertRaises(TypeError):
+            list(iter_xliff_files(FILENAME_PAGE_XML))
@@ -0,0 +1,238 @@
+"""
+Translate multilingual Page XML in batches, with multiple requests in flight to the translation backend.
+
+# Examples on how to use.
+>> l_xml = [XLIFFPageXML.from_page(filename, source_lang='nl') for filename in l_filenames]
+>> driver = TranslationDriver(EchoBackend(), max_chars=5000, max_segments=100, max_in_flight=4)
+>> driver.translate(l_xml, source_lang='nl', target_lang='en')
+
+# Streaming over a volume, saving every page as soon as it is translated.
+>> l_xml = (XLIFFPageXML.from_page(filename, source_lang='nl') for filename in l_filenames)
+>> driver.translate(l_xml, source_lang='nl', target_lang='en', on_page_done=lambda xml: xml.write(...))
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from .elements import TransUnit
+from .orm import XLIFFPageXML
+
+
+class TranslationBackend(ABC):
+    """
+    An abstract class for the services that translate text, e.g. CEF eTranslation.
+    """
+
+    @abstractmethod
+    async def translate(self, l_text: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """ Translate a batch of segments.
+
+        :param l_text: source text of each segment.
+        :param source_lang: language of the source text.
+        :param target_lang: language to translate to.
+        :return:
+            the translation of each segment, in the same order.
+        """
+        pass
+
+
+class EchoBackend(TranslationBackend):
+    """
+    Local backend that returns the source text, to test the translation without a translation service.
+    """
+
+    def __init__(self, prefix: str = '', delay: float = 0.):
+        """
+
+        :param prefix: prefix added to every translation, e.g. to recognise the mock translations.
+        :param delay: seconds to wait per request, to simulate the latency of a translation service.
+        """
+        self.prefix = prefix
+        self.delay = delay
+
+    async def translate(self, l_text: List[str], source_lang: str, target_lang: str) -> List[str]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        return [f'{self.prefix}{text}' for text in l_text]
+
+
+class TranslationDriver:
+    """
+    Collects the trans-units of the pages into size-bounded batches and sends them to the backend,
+    keeping a number of batches in flight. Translations are written back into the trans-units as targets.
+    """
+
+    def __init__(self,
+                 backend: TranslationBackend,
+                 max_chars: int = 5000,
+                 max_segments: int = 100,
+                 max_in_flight: int = 4,
+                 max_retries: int = 3,
+                 retry_delay: float = 1.):
+        """
+
+        :param backend: translation service.
+        :param max_chars: maximum number of source characters in a batch.
+            A single segment that is longer is sent on its own.
+        :param max_segments: maximum number of segments in a batch.
+        :param max_in_flight: number of batches that are translated concurrently.
+        :param max_retries: number of retries of a failed batch before giving up.
+        :param retry_delay: seconds to wait before the first retry, doubled with every retry.
+        """
+
+        if max_chars < 1 or max_segments < 1 or max_in_flight < 1:
+            raise ValueError('max_chars, max_segments and max_in_flight should be at least 1.')
+        if max_retries < 0:
+            raise ValueError('max_retries should be at least 0.')
+
+        self.backend = backend
+        self.max_chars = max_chars
+        self.max_segments = max_segments
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    def translate(self, l_xml: Iterable[XLIFFPageXML], source_lang: str, target_lang: str,
+                  on_page_done: Callable[[XLIFFPageXML], None] = None) -> int:
+        """ Blocking version of translate_async.
+        """
+        return asyncio.run(self.translate_async(l_xml, source_lang=source_lang, target_lang=target_lang,
+                                                on_page_done=on_page_done))
+
+    async def translate_async(self, l_xml: Iterable[XLIFFPageXML], source_lang: str, target_lang: str,
+                              on_page_done: Callable[[XLIFFPageXML], None] = None) -> int:
+        """ Translate all the trans-units of the pages and add the translations as targets.
+
+        Pages are walked while earlier batches are being translated.
+        Trans-units without source text get an empty target without being sent.
+
+        The translations are written back through the TransUnit objects of the batch, not by trans-unit id:
+        XLIFFPageXML.from_page reuses ids such as r000-l000 on every page and batches span multiple pages.
+
+        :param l_xml: multilingual Page XML's, e.g. made by XLIFFPageXML.from_page.
+            This can be a lazy generator, use on_page_done to keep or save the translated pages.
+        :param source_lang: language of the source text.
+        :param target_lang: language to translate to.
+        :param on_page_done: called with each page as soon as all its trans-units are translated,
+            e.g. to write it to disk. Pages are not necessarily done in order.
+        :return:
+            number of translated trans-units.
+        :raises:
+            the last error of the backend if a batch still fails after max_retries retries.
+        """
+
+        queue = asyncio.Queue(maxsize=self.max_in_flight)
+
+        async def produce():
+            for batch in self._iter_batches(l_xml, target_lang, on_page_done):
+                await queue.put(batch)
+            for _ in range(self.max_in_flight):
+                await queue.put(None)
+
+        async def consume():
+            n = 0
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return n
+
+                l_target = await self._translate_batch([trans_unit.source for _, trans_unit in batch],
+                                                       source_lang, target_lang)
+                for (page, trans_unit), target_text in zip(batch, l_target):
+                    trans_unit.set_target(target_lang, target_text)
+
+                    page.n_pending -= 1
+                    if page.b_walked and not page.n_pending and on_page_done is not None:
+                        on_page_done(page.xml)
+                n += len(batch)
+
+        tasks = [asyncio.ensure_future(produce())] + \
+                [asyncio.ensure_future(consume()) for _ in range(self.max_in_flight)]
+        try:
+            l_n = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return sum(l_n[1:])
+
+    def iter_batches(self, l_xml: Iterable[XLIFFPageXML], target_lang: str = None) -> Iterator[List[TransUnit]]:
+        """ Group the trans-units of the pages into batches of at most max_segments segments and max_chars characters.
+
+        :param l_xml: multilingual Page XML's.
+        :param target_lang: if given, trans-units without source text get an empty target and are not batched.
+        :return:
+            batches of trans-units, possibly spanning multiple pages.
+        """
+
+        for batch in self._iter_batches(l_xml, target_lang):
+            yield [trans_unit for _, trans_unit in batch]
+
+    def _iter_batches(self, l_xml: Iterable[XLIFFPageXML], target_lang: str = None,
+                      on_page_done: Callable[[XLIFFPageXML], None] = None) \
+            -> Iterator[List[Tuple['_PageProgress', TransUnit]]]:
+        """ iter_batches, keeping track of the number of trans-units of each page that still have to be translated.
+        """
+
+        batch = []
+        n_chars = 0
+        for xml in l_xml:
+            page = _PageProgress(xml)
+
+            for trans_unit in xml.iter_trans_units():
+                source = trans_unit.source
+                if not source.strip():
+                    if target_lang is not None:
+                        trans_unit.set_target(target_lang, '')
+                    continue
+
+                if batch and (len(batch) >= self.max_segments or n_chars + len(source) > self.max_chars):
+                    yield batch
+                    batch = []
+                    n_chars = 0
+
+                batch.append((page, trans_unit))
+                page.n_pending += 1
+                n_chars += len(source)
+
+            page.b_walked = True
+            # Everything already translated (or nothing to translate).
+            if not page.n_pending and on_page_done is not None:
+                on_page_done(xml)
+
+        if batch:
+            yield batch
+
+    async def _translate_batch(self, l_text: List[str], source_lang: str, target_lang: str) -> List[str]:
+        delay = self.retry_delay
+        for i_try in range(self.max_retries + 1):
+            try:
+                l_target = await self.backend.translate(l_text, source_lang, target_lang)
+                if len(l_target) != len(l_text):
+                    raise ValueError(f'Expected {len(l_text)} translations, got {len(l_target)}.')
+                return l_target
+
+            except Exception:
+                if i_try >= self.max_retries:
+                    raise
+
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        raise RuntimeError('Unreachable: the last try either returns or raises.')
+
+
+class _PageProgress:
+    """
+    Number of trans-units of a page that are batched but not translated yet.
+    """
+
+    __slots__ = ('xml', 'n_pending', 'b_walked')
+
+    def __init__(self, xml: XLIFFPageXML):
+        self.xml = xml
+        self.n_pending = 0
+        self.b_walked = False
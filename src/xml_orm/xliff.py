@@ -0,0 +1,260 @@
+"""
+Standalone XLIFF files for CAT tools and MT gateways, from and to multilingual Page XML.
+
+Both export and import are streaming: only a single page is kept in memory at a time,
+such that one XLIFF file can cover an entire volume.
+
+# Examples on how to use.
+>> export_xliff('PATH_TO_XLIFF', ['PATH_TO_MULTILINGUAL_PAGE_XML', ...], source_lang='nl', target_lang='en')
+>> # ... translate PATH_TO_XLIFF ...
+>> for original, xml in import_xliff('PATH_TO_XLIFF'):
+>>     xml.write(original)
+"""
+
+import os
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from lxml import etree
+
+from .orm import XLIFFPageXML, XML_NAMESPACE, _get_tag
+
+XLIFF_NAMESPACES = {'1.2': 'urn:oasis:names:tc:xliff:document:1.2',
+                    '2.0': 'urn:oasis:names:tc:xliff:document:2.0'}
+
+_TAG_LANG = _get_tag("lang", XML_NAMESPACE)
+
+
+class XLIFFWriter:
+    """
+    Write the trans-units of multilingual Page XML's incrementally to a single XLIFF file, with a file element per page.
+
+    >> with XLIFFWriter('PATH_TO_XLIFF', source_lang='nl', target_lang='en') as writer:
+    >>     writer.add_page(xml, original='PATH_TO_MULTILINGUAL_PAGE_XML')
+    """
+
+    def __init__(self, filename, source_lang, target_lang=None, version='1.2'):
+        """
+
+        :param filename: XLIFF file (or file-like object) to write to.
+        :param source_lang: language of the source text.
+        :param target_lang: language of the translation. Existing targets in this language are exported too.
+        :param version: XLIFF version, '1.2' or '2.0'.
+        """
+
+        if version not in XLIFF_NAMESPACES:
+            raise ValueError(f'Unsupported XLIFF version: {version}. Expected one of {list(XLIFF_NAMESPACES)}')
+
+        self.filename = filename
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.version = version
+        self.xmlns = XLIFF_NAMESPACES[version]
+
+        self._exit_stack = None
+        self._xf = None
+        self._n_files = 0
+
+    def __enter__(self):
+        attrib = {'version': self.version}
+        if self.version == '2.0':
+            attrib['srcLang'] = self.source_lang
+            if self.target_lang:
+                attrib['trgLang'] = self.target_lang
+
+        with ExitStack() as stack:
+            self._xf = stack.enter_context(etree.xmlfile(self.filename, encoding='UTF-8'))
+            self._xf.write_declaration(standalone=True)
+            stack.enter_context(self._xf.element(_get_tag('xliff', self.xmlns), attrib, nsmap={None: self.xmlns}))
+            self._exit_stack = stack.pop_all()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._exit_stack.__exit__(exc_type, exc_val, exc_tb)
+
+    def add_page(self, xml: XLIFFPageXML, original: str):
+        """ Write the trans-units of a single page as a file element.
+
+        :param xml: multilingual Page XML, e.g. made by XLIFFPageXML.from_page.
+        :param original: reference to the page, e.g. its filename, used to merge the translations back.
+        """
+
+        self._n_files += 1
+
+        if self.version == '2.0':
+            el_file = self._get_file_2_0(xml, original)
+        else:
+            el_file = self._get_file_1_2(xml, original)
+
+        self._xf.write(el_file, pretty_print=True)
+        self._xf.flush()
+
+    def _get_file_1_2(self, xml: XLIFFPageXML, original) -> etree.ElementBase:
+        attrib = {'original': original,
+                  'source-language': self.source_lang,
+                  'datatype': 'plaintext'}
+        if self.target_lang:
+            attrib['target-language'] = self.target_lang
+
+        el_file = etree.Element(_get_tag('file', self.xmlns), attrib, nsmap={None: self.xmlns})
+        el_body = etree.SubElement(el_file, _get_tag('body', self.xmlns))
+
+        for id_unit, source_text, target_text in _iter_trans_units(xml, self.target_lang):
+            el_unit = etree.SubElement(el_body, _get_tag('trans-unit', self.xmlns), id=id_unit)
+            etree.SubElement(el_unit, _get_tag('source', self.xmlns)).text = source_text
+            if target_text is not None:
+                etree.SubElement(el_unit, _get_tag('target', self.xmlns)).text = target_text
+
+        return el_file
+
+    def _get_file_2_0(self, xml: XLIFFPageXML, original) -> etree.ElementBase:
+        el_file = etree.Element(_get_tag('file', self.xmlns), {'id': f'f{self._n_files}', 'original': original},
+                                nsmap={None: self.xmlns})
+
+        for id_unit, source_text, target_text in _iter_trans_units(xml, self.target_lang):
+            el_unit = etree.SubElement(el_file, _get_tag('unit', self.xmlns), id=id_unit)
+            el_segment = etree.SubElement(el_unit, _get_tag('segment', self.xmlns))
+            etree.SubElement(el_segment, _get_tag('source', self.xmlns)).text = source_text
+            if target_text is not None:
+                etree.SubElement(el_segment, _get_tag('target', self.xmlns)).text = target_text
+
+        return el_file
+
+
+def export_xliff(filename, l_filenames_page: Iterable[str], source_lang, target_lang=None, version='1.2'):
+    """ Export the trans-units of many multilingual Page XML files into a single XLIFF file.
+
+    The pages are read one by one. The filename of each page, relative to the XLIFF file,
+    is saved as the original of its file element.
+
+    :param filename: XLIFF file to write to.
+    :param l_filenames_page: multilingual Page XML files, as made by XLIFFPageXML.from_page.
+    :param source_lang: language of the source text.
+    :param target_lang: language of the translation.
+    :param version: XLIFF version, '1.2' or '2.0'.
+    :return:
+    """
+
+    dirname = os.path.dirname(os.path.abspath(filename))
+
+    with XLIFFWriter(filename, source_lang=source_lang, target_lang=target_lang, version=version) as writer:
+        for filename_page in l_filenames_page:
+            writer.add_page(XLIFFPageXML(filename_page), original=os.path.relpath(filename_page, dirname))
+
+    return
+
+
+def iter_xliff_files(filename) -> Iterator[Tuple[str, Optional[str], Dict[str, str]]]:
+    """ Stream over the file elements of an XLIFF 1.2 or 2.0 file.
+
+    :param filename: XLIFF file.
+    :return:
+        per file element: (original, target language, targets per trans-unit id).
+        Inline markup of the targets is dropped, keeping its text.
+        For XLIFF 2.0, the targets of all the segments and ignorables of a unit are joined,
+        with the source of an ignorable if it has no target.
+        Trans-units without target are left out.
+    """
+
+    xmlns = None
+    target_lang_root = None
+
+    # Whitespace is kept: inside a target, e.g. between inline elements, it is content.
+    context = etree.iterparse(filename, events=('start', 'end'))
+    for event, el in context:
+        if event == 'start':
+            if xmlns is None:  # Root
+                xmlns = etree.QName(el).namespace
+                if xmlns not in XLIFF_NAMESPACES.values():
+                    raise TypeError('Not a valid XLIFF file (namespace declaration missing)')
+
+                target_lang_root = el.get('trgLang')
+            continue
+
+        if el.tag != _get_tag('file', xmlns):
+            continue
+
+        target_lang = el.get('target-language', target_lang_root)
+
+        tag_target = _get_tag('target', xmlns)
+
+        d_targets = {}
+        for el_unit in el.iter(_get_tag('trans-unit', xmlns)):  # 1.2
+            # Direct child only, not the targets of alt-trans.
+            el_target = el_unit.find(tag_target)
+            if el_target is not None:
+                d_targets[el_unit.get('id')] = _get_text(el_target)
+
+                if target_lang is None:
+                    target_lang = el_target.get(_TAG_LANG)
+
+        tag_segment = _get_tag('segment', xmlns)
+        tag_ignorable = _get_tag('ignorable', xmlns)
+        tag_source = _get_tag('source', xmlns)
+        for el_unit in el.iter(_get_tag('unit', xmlns)):  # 2.0
+            b_target = False
+            l_text = []
+            # Segments and ignorables (spacing, punctuation, ...) in document order.
+            for el_part in el_unit.iterchildren(tag_segment, tag_ignorable):
+                el_target = el_part.find(tag_target)
+                if el_target is not None:
+                    b_target |= el_part.tag == tag_segment
+                    l_text.append(_get_text(el_target))
+                elif el_part.tag == tag_ignorable:
+                    el_source = el_part.find(tag_source)
+                    if el_source is not None:
+                        l_text.append(_get_text(el_source))
+
+            if b_target:
+                d_targets[el_unit.get('id')] = ''.join(l_text)
+
+        yield el.get('original'), target_lang, d_targets
+
+        # Free the memory of the processed file elements.
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+
+
+def import_xliff(filename, open_page: Callable[[str], XLIFFPageXML] = None, target_lang=None) \
+        -> Iterator[Tuple[str, XLIFFPageXML]]:
+    """ Merge a translated XLIFF file back into the multilingual Page XML files, one page at a time.
+
+    :param filename: translated XLIFF file, e.g. made by export_xliff.
+    :param open_page: opens the multilingual Page XML of the original of a file element.
+        By default the original is used as filename, relative to the directory of the XLIFF file.
+    :param target_lang: language of the translation, if not defined in the XLIFF file.
+    :return:
+        per page: (original, multilingual Page XML with the added targets).
+    """
+
+    if open_page is None:
+        dirname = os.path.dirname(filename) if isinstance(filename, str) else ''
+
+        def open_page(original):
+            return XLIFFPageXML(os.path.join(dirname, original))
+
+    for original, target_lang_file, d_targets in iter_xliff_files(filename):
+        lang = target_lang_file or target_lang
+        if lang is None:
+            raise ValueError(f'Target language of {original} is unknown.')
+
+        xml = open_page(original)
+        xml.set_targets(d_targets, lang)
+
+        yield original, xml
+
+
+def _iter_trans_units(xml: XLIFFPageXML, target_lang=None) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """ (id, source text, target text in target_lang or None) of every trans-unit of a page. """
+
+    for trans_unit in xml.iter_trans_units():
+        target_text = trans_unit.get_target(target_lang) if target_lang is not None else None
+
+        yield trans_unit.id, trans_unit.source, target_text
+
+
+def _get_text(el_target) -> str:
+    """ Text of a target (or source), including the text inside inline markup such as <g> or <mrk>. """
+    return ''.join(el_target.itertext())
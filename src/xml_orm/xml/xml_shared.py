@@ -5,6 +5,8 @@ import requests
 from lxml import etree
 from lxml.etree import tostring, XMLParser, fromstring
 
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
 
 def extract_simple_tags(tree):
     l_tags = [elem.tag for elem in tree.iter()]
@@ -171,3 +173,7 @@ def _change_namespace(root, target_namespace):
     root_target = etree.fromstring(s_comb)
 
     return root_target
+
+
+def _get_tag(tag, namespace):
+    return f'{{{namespace}}}{tag}'